@@ -4,6 +4,7 @@ Main Coordinator System Prompt for Polly
 This prompt guides the main agent session and coordinates the use of skills.
 """
 
+import os
 import re
 from pathlib import Path
 from typing import List, Dict
@@ -260,8 +261,6 @@ def get_coordinator_prompt(project_directory: str, skills_directory: Path) -> st
     Returns:
         Formatted coordinator system prompt
     """
-    import os
-
     # Load skill metadata
     skills = load_skill_metadata(skills_directory)
     skills_metadata_formatted = format_skills_metadata(skills)
@@ -271,13 +270,12 @@ def get_coordinator_prompt(project_directory: str, skills_directory: Path) -> st
     future_features_directory = os.path.join(project_directory, "future-features")
     prompts_directory = os.path.join(project_directory, "prompts")
 
-    # Inject paths and metadata into the prompt
-    prompt = COORDINATOR_SYSTEM_PROMPT
-    prompt = prompt.replace("{project_directory}", project_directory)
-    prompt = prompt.replace("{features_directory}", features_directory)
-    prompt = prompt.replace("{future_features_directory}", future_features_directory)
-    prompt = prompt.replace("{prompts_directory}", prompts_directory)
-    prompt = prompt.replace("{skills_directory}", str(skills_directory))
-    prompt = prompt.replace("{skills_metadata}", skills_metadata_formatted)
-
-    return prompt
+    # Inject paths and metadata into the prompt in a single pass
+    return COORDINATOR_SYSTEM_PROMPT.format_map({
+        "project_directory": project_directory,
+        "features_directory": features_directory,
+        "future_features_directory": future_features_directory,
+        "prompts_directory": prompts_directory,
+        "skills_directory": str(skills_directory),
+        "skills_metadata": skills_metadata_formatted,
+    })
@@ -8,6 +8,7 @@ Prompt Toolkit integration for enhanced input handling.
 from rich.console import Console
 from rich.panel import Panel
 from rich.markdown import Markdown
+from rich.table import Table
 from rich.theme import Theme
 from rich.text import Text
 from prompt_toolkit import PromptSession
@@ -52,10 +53,11 @@ class LeftAlignedHeading(RichHeading):
 class LeftAlignedMarkdown(Markdown):
     """Markdown subclass that left-aligns all headings."""
 
+    # Use our left-aligned Heading class without touching Markdown's own table
+    elements = {**Markdown.elements, "heading_open": LeftAlignedHeading}
+
     def __init__(self, markup, **kwargs):
         super().__init__(markup, inline_code_lexer=None, hyperlinks=False, **kwargs)
-        # Replace the Heading class with our left-aligned version
-        self.elements["heading_open"] = LeftAlignedHeading
 
 
 # Helper function to create left-aligned markdown
@@ -98,8 +100,6 @@ Start with **Feature Identification** to identify application features. Polly wi
 Expand on existing feature stubs or define new features with **Feature Discovery**. Then move on to **Increment Grouping** and **Prompt Generation** to create your prompts!"""
 
     # Create the 2-column layout with specific widths
-    from rich.table import Table
-
     table = Table.grid(padding=(0, 2))
     table.add_column(width=25)  # Fixed width for ASCII art
     table.add_column()  # Flexible width for instructions
@@ -148,7 +148,7 @@ def print_tool_usage(tool_name: str):
     Args:
         tool_name: Name of the tool being used
     """
-    console.print(f"[tool][Using {tool_name}...][/tool]", end="")
+    console.print(f"[tool][Using {tool_name}...][/tool]")
 
 
 def print_error(message: str):
@@ -187,6 +187,11 @@ def print_warning(message: str):
     console.print(f"[warning]{message}[/warning]")
 
 
+def print_goodbye():
+    """Display exit message."""
+    console.print("\n[info]Exiting Feature Breakdown Agent. Goodbye![/info]")
+
+
 def print_captured_features(feature_paths: list[str]):
     """Display list of captured future features.
 
@@ -196,9 +201,10 @@ def print_captured_features(feature_paths: list[str]):
     if not feature_paths:
         return
 
-    content = f"[success]Captured {len(feature_paths)} future feature(s) for later planning:[/success]\n\n"
-    for path in feature_paths:
-        content += f"  • {path}\n"
+    content = (
+        f"[success]Captured {len(feature_paths)} future feature(s) for later planning:[/success]\n\n"
+        + "".join(f"  • {path}\n" for path in feature_paths)
+    )
 
     console.print(Panel(
         content,
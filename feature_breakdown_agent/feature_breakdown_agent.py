@@ -7,9 +7,11 @@ into detailed, incremental coding prompts using Claude Skills.
 
 import sys
 import os
+import importlib.util
+import traceback
 import anyio
 from pathlib import Path
-from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions
+from typing import TYPE_CHECKING
 
 from .display import (
     print_welcome,
@@ -17,11 +19,79 @@ from .display import (
     print_tool_usage,
     print_error,
     print_info,
+    print_goodbye,
     UserInput,
     console,
 )
 from .coordinator_prompt import get_coordinator_prompt
 
+if TYPE_CHECKING:
+    from claude_agent_sdk import ClaudeSDKClient
+
+
+# First message sent to the agent to kick off project exploration
+INITIAL_EXPLORATION_PROMPT = """The user's project is located at: {project_directory}
+
+Please start by exploring the project:
+1. Check if there's a "features/" directory and read any existing feature files
+2. Check if there's a "future-features/" directory with feature stubs
+3. Summarize what you found (or note this is a new project)
+4. Based on what you learned, let the user know what they can do next
+
+Remember:
+- Be conversational and friendly
+- Explain what you're doing as you explore
+- Present options when it would be helpful
+- Be ready to invoke skills based on the user's needs
+
+Start exploring now."""
+
+
+async def _drive_agent_turn(client: "ClaudeSDKClient", prompt: str) -> None:
+    """Send a prompt to the agent and display its response as it arrives.
+
+    Args:
+        client: The connected SDK client for the session
+        prompt: The message to send to the agent
+    """
+    from claude_agent_sdk import (
+        AssistantMessage,
+        ResultMessage,
+        TextBlock,
+        ToolUseBlock,
+    )
+
+    await client.query(prompt)
+
+    first_block = True
+    displayed_text = False
+
+    # Collect and display response from agent as it arrives
+    async for message in client.receive_response():
+        if isinstance(message, AssistantMessage):
+            for block in message.content:
+                if isinstance(block, TextBlock):
+                    # Display agent label before first content
+                    if first_block:
+                        console.print("[agent]Agent:[/agent]\n")
+                        first_block = False
+
+                    # Add spacing before subsequent text blocks
+                    if displayed_text:
+                        console.print()
+
+                    # Display text immediately as it arrives
+                    print_agent_message_streaming(block.text)
+                    displayed_text = True
+                elif isinstance(block, ToolUseBlock):
+                    print_tool_usage(block.name)
+        elif isinstance(message, ResultMessage):
+            break
+
+    # Add spacing after response (only if we displayed something)
+    if displayed_text:
+        console.print()
+
 
 async def run_agent():
     """Run the main Polly agent with a single long-running session."""
@@ -59,7 +129,7 @@ async def run_agent():
     ).ask_async()
 
     if folder_choice is None:
-        console.print("\n[info]Exiting Feature Breakdown Agent. Goodbye![/info]")
+        print_goodbye()
         return
 
     if folder_choice == "Use this folder":
@@ -70,7 +140,7 @@ async def run_agent():
         user_input = await user_input_handler.get_input("Enter project folder path: ")
 
         if user_input.lower() in ['exit', 'quit']:
-            console.print("\n[info]Exiting Feature Breakdown Agent. Goodbye![/info]")
+            print_goodbye()
             return
 
         project_directory = user_input.rstrip('/') if user_input else "."
@@ -82,6 +152,10 @@ async def run_agent():
     package_dir = Path(__file__).parent
     skills_directory = package_dir / "skills"
 
+    # The SDK is slow to import, so load it only once the banner and folder
+    # prompt are already on screen
+    from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions
+
     # Get coordinator system prompt with project directory and skills injected
     coordinator_prompt = get_coordinator_prompt(project_directory, skills_directory)
 
@@ -101,61 +175,11 @@ async def run_agent():
     # Use ClaudeSDKClient for single long-running session
     async with ClaudeSDKClient(options=options) as client:
         # Initial prompt to start the agent
-        initial_prompt = f"""The user's project is located at: {os.path.abspath(project_directory)}
-
-Please start by exploring the project:
-1. Check if there's a "features/" directory and read any existing feature files
-2. Check if there's a "future-features/" directory with feature stubs
-3. Summarize what you found (or note this is a new project)
-4. Based on what you learned, let the user know what they can do next
+        initial_prompt = INITIAL_EXPLORATION_PROMPT.format(
+            project_directory=os.path.abspath(project_directory)
+        )
 
-Remember:
-- Be conversational and friendly
-- Explain what you're doing as you explore
-- Present options when it would be helpful
-- Be ready to invoke skills based on the user's needs
-
-Start exploring now."""
-
-        await client.query(initial_prompt)
-
-        response_text = ""
-        first_block = True
-        displayed_text = False
-
-        # Collect and display initial response as it arrives
-        async for message in client.receive_response():
-            message_class = type(message).__name__
-
-            if message_class == "AssistantMessage":
-                if hasattr(message, 'content'):
-                    for block in message.content:
-                        block_type = type(block).__name__
-                        if block_type == "TextBlock":
-                            # Display agent label before first content
-                            if first_block:
-                                console.print("[agent]Agent:[/agent]")
-                                console.print()
-                                first_block = False
-
-                            # Add spacing before subsequent text blocks
-                            if displayed_text:
-                                console.print()
-
-                            # Display text immediately as it arrives
-                            print_agent_message_streaming(block.text)
-                            response_text += block.text
-                            displayed_text = True
-                        elif block_type == "ToolUseBlock":
-                            tool_name = getattr(block, 'name', 'unknown')
-                            print_tool_usage(tool_name)
-                            console.print()
-            elif message_class == "ResultMessage":
-                break
-
-        # Add spacing after response (only if we displayed something)
-        if displayed_text:
-            console.print()
+        await _drive_agent_turn(client, initial_prompt)
 
         # Main conversation loop
         while True:
@@ -167,54 +191,15 @@ Start exploring now."""
                     continue
 
                 if user_input.lower() in ['exit', 'quit']:
-                    console.print("\n[info]Exiting Feature Breakdown Agent. Goodbye![/info]")
+                    print_goodbye()
                     return
 
                 prompt = user_input
 
-                # Send query to agent
-                await client.query(prompt)
-
                 console.print()
 
-                response_text = ""
-                first_block = True
-                displayed_text = False
-
-                # Collect and display response from agent as it arrives
-                async for message in client.receive_response():
-                    # Check message type using class name
-                    message_class = type(message).__name__
-
-                    if message_class == "AssistantMessage":
-                        if hasattr(message, 'content'):
-                            for block in message.content:
-                                block_type = type(block).__name__
-                                if block_type == "TextBlock":
-                                    # Display agent label before first content
-                                    if first_block:
-                                        console.print("[agent]Agent:[/agent]")
-                                        console.print()
-                                        first_block = False
-
-                                    # Add spacing before subsequent text blocks
-                                    if displayed_text:
-                                        console.print()
-
-                                    # Display text immediately as it arrives
-                                    print_agent_message_streaming(block.text)
-                                    response_text += block.text
-                                    displayed_text = True
-                                elif block_type == "ToolUseBlock":
-                                    tool_name = getattr(block, 'name', 'unknown')
-                                    print_tool_usage(tool_name)
-                                    console.print()
-                    elif message_class == "ResultMessage":
-                        break
-
-                # Add spacing after response (only if we displayed something)
-                if displayed_text:
-                    console.print()
+                # Send query to agent and display its response
+                await _drive_agent_turn(client, prompt)
 
             except KeyboardInterrupt:
                 console.print("\n")
@@ -223,14 +208,18 @@ Start exploring now."""
             except Exception as e:
                 console.print("\n")
                 print_error(str(e))
-                import traceback
                 traceback.print_exc()
                 print_info("Please try again or type 'exit' to quit.")
 
 
 def main():
     """Main entry point for the Feature Breakdown Agent."""
-    anyio.run(run_agent)
+    # Use uvloop's libuv-based event loop when it is installed
+    backend_options = {}
+    if importlib.util.find_spec("uvloop") is not None:
+        backend_options["use_uvloop"] = True
+
+    anyio.run(run_agent, backend_options=backend_options)
 
 
 if __name__ == "__main__":
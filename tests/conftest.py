@@ -1,131 +1,47 @@
-"""Pytest configuration and shared fixtures."""
-
-import pytest
-from pathlib import Path
-import tempfile
-import shutil
-
-
-@pytest.fixture
-def temp_features_dir():
-    """Create a temporary directory with sample feature files."""
-    temp_dir = tempfile.mkdtemp()
-    features_dir = Path(temp_dir) / "features"
-    features_dir.mkdir()
-
-    # Create sample feature files
-    (features_dir / "auth.md").write_text("""# Authentication Feature
-
-## Overview
-User authentication with email/password.
-
-## Components
-- Login form
-- Session management
-- Password hashing
-
-## Dependencies
-- bcrypt library
-- JWT tokens
-""")
-
-    (features_dir / "profile.md").write_text("""# Profile Feature
-
-## Overview
-User profile management.
-
-## Components
-- Profile view
-- Edit form
-- Avatar upload
-
-## Dependencies
-- Auth feature
-- AWS S3
-""")
-
-    yield features_dir
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
+"""Pytest configuration and shared fixtures.
 
+Fixtures that only build read-only sample data are session-scoped, so
+tests that use them must not modify the files they create.
+"""
 
-@pytest.fixture
-def empty_features_dir():
-    """Create an empty temporary features directory."""
-    temp_dir = tempfile.mkdtemp()
-    features_dir = Path(temp_dir) / "features"
-    features_dir.mkdir()
-
-    yield features_dir
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
-
-
-@pytest.fixture
-def temp_project_structure():
-    """Create complete temporary project structure."""
-    temp_dir = tempfile.mkdtemp()
-    project = Path(temp_dir) / "project"
-
-    # Create directory structure
-    (project / "features").mkdir(parents=True)
-    (project / "future-features").mkdir(parents=True)
-    (project / "prompts").mkdir(parents=True)
-
-    yield project
-
-    # Cleanup
-    shutil.rmtree(temp_dir)
+import pytest
 
+from feature_breakdown_agent.coordinator_prompt import get_coordinator_prompt
 
-@pytest.fixture
-def temp_skills_dir():
-    """Create temporary skills directory with valid SKILL.md files."""
-    temp_dir = tempfile.mkdtemp()
-    skills_dir = Path(temp_dir) / "skills"
 
-    # Create a valid mock skill
-    skill_dir = skills_dir / "test-skill"
-    skill_dir.mkdir(parents=True)
-    (skill_dir / "SKILL.md").write_text("""---
+# SKILL.md contents for the sample skills, keyed by skill directory name
+SAMPLE_SKILLS = {
+    "test-skill": b"""---
 name: test-skill
 description: A test skill for validation
 ---
 # Test Skill Instructions
 
-This is a test skill.""")
-
-    # Create another skill
-    skill2_dir = skills_dir / "another-skill"
-    skill2_dir.mkdir(parents=True)
-    (skill2_dir / "SKILL.md").write_text("""---
+This is a test skill.""",
+    "another-skill": b"""---
 name: another-skill
 description: Another test skill
 ---
 # Another Skill
 
-More instructions.""")
+More instructions.""",
+}
+
+
+@pytest.fixture(scope="session")
+def temp_skills_dir(tmp_path_factory):
+    """Create temporary skills directory with valid SKILL.md files."""
+    skills_dir = tmp_path_factory.mktemp("package") / "skills"
 
-    yield skills_dir
+    for skill_name, skill_md in SAMPLE_SKILLS.items():
+        skill_dir = skills_dir / skill_name
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_bytes(skill_md)
 
-    # Cleanup
-    shutil.rmtree(temp_dir)
+    return skills_dir
 
 
-@pytest.fixture
-def mock_skill_metadata():
-    """Return sample skill metadata (no files needed)."""
-    return [
-        {
-            "name": "test-skill",
-            "description": "A test skill for validation",
-            "path": "skills/test-skill/SKILL.md"
-        },
-        {
-            "name": "another-skill",
-            "description": "Another test skill",
-            "path": "skills/another-skill/SKILL.md"
-        }
-    ]
+@pytest.fixture(scope="session")
+def coordinator_prompt(temp_skills_dir):
+    """Return the coordinator prompt built once for the sample skills."""
+    return get_coordinator_prompt("/test/project", temp_skills_dir)
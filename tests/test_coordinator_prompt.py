@@ -1,9 +1,9 @@
 """Tests for coordinator_prompt.py module."""
 
+import re
 import pytest
 from pathlib import Path
-import tempfile
-import shutil
+from types import MappingProxyType
 
 from feature_breakdown_agent.coordinator_prompt import (
     load_skill_metadata,
@@ -12,6 +12,28 @@ from feature_breakdown_agent.coordinator_prompt import (
 )
 
 
+# Any placeholder that get_coordinator_prompt is expected to fill in
+PLACEHOLDER_PATTERN = re.compile(
+    r"\{(project_directory|features_directory|future_features_directory"
+    r"|prompts_directory|skills_directory|skills_metadata)\}"
+)
+
+
+# Read-only sample skill metadata (no files needed)
+MOCK_SKILL_METADATA = (
+    MappingProxyType({
+        "name": "test-skill",
+        "description": "A test skill for validation",
+        "path": "skills/test-skill/SKILL.md"
+    }),
+    MappingProxyType({
+        "name": "another-skill",
+        "description": "Another test skill",
+        "path": "skills/another-skill/SKILL.md"
+    }),
+)
+
+
 class TestLoadSkillMetadata:
     """Test the load_skill_metadata function."""
 
@@ -41,61 +63,35 @@ class TestLoadSkillMetadata:
 
         assert skills == []
 
-    def test_empty_directory(self):
-        """Should return empty list for directory with no skills."""
-        temp_dir = tempfile.mkdtemp()
-        skills_dir = Path(temp_dir) / "skills"
+    @pytest.mark.parametrize("skill_md", [
+        # Empty skills directory
+        None,
+        # SKILL.md with missing frontmatter
+        b"# Bad Skill\nNo frontmatter here!",
+        # SKILL.md with only a description
+        b"---\ndescription: Missing name field\n---\n# Incomplete Skill",
+        # SKILL.md with only a name
+        b"---\nname: incomplete-skill\n---\n# Incomplete Skill",
+    ], ids=["empty", "malformed", "missing_name", "missing_description"])
+    def test_skips_invalid_skills(self, tmp_path, skill_md):
+        """Should return empty list when no skill has valid frontmatter."""
+        skills_dir = tmp_path / "skills"
         skills_dir.mkdir()
 
-        try:
-            skills = load_skill_metadata(skills_dir)
-            assert skills == []
-        finally:
-            shutil.rmtree(temp_dir)
-
-    def test_malformed_yaml_frontmatter(self):
-        """Should skip skills with malformed YAML frontmatter."""
-        temp_dir = tempfile.mkdtemp()
-        skills_dir = Path(temp_dir) / "skills"
-        bad_skill_dir = skills_dir / "bad-skill"
-        bad_skill_dir.mkdir(parents=True)
-
-        # Create SKILL.md with missing frontmatter
-        (bad_skill_dir / "SKILL.md").write_text("""# Bad Skill
-No frontmatter here!""")
-
-        try:
-            skills = load_skill_metadata(skills_dir)
-            assert skills == []  # Should skip malformed skill
-        finally:
-            shutil.rmtree(temp_dir)
-
-    def test_missing_name_field(self):
-        """Should skip skills missing required name field."""
-        temp_dir = tempfile.mkdtemp()
-        skills_dir = Path(temp_dir) / "skills"
-        incomplete_skill_dir = skills_dir / "incomplete-skill"
-        incomplete_skill_dir.mkdir(parents=True)
-
-        # Create SKILL.md with only description
-        (incomplete_skill_dir / "SKILL.md").write_text("""---
-description: Missing name field
----
-# Incomplete Skill""")
+        if skill_md is not None:
+            skill_dir = skills_dir / "bad-skill"
+            skill_dir.mkdir()
+            (skill_dir / "SKILL.md").write_bytes(skill_md)
 
-        try:
-            skills = load_skill_metadata(skills_dir)
-            assert skills == []
-        finally:
-            shutil.rmtree(temp_dir)
+        assert load_skill_metadata(skills_dir) == []
 
 
 class TestFormatSkillsMetadata:
     """Test the format_skills_metadata function."""
 
-    def test_format_multiple_skills(self, mock_skill_metadata):
+    def test_format_multiple_skills(self):
         """Should format multiple skills as markdown list."""
-        formatted = format_skills_metadata(mock_skill_metadata)
+        formatted = format_skills_metadata(MOCK_SKILL_METADATA)
 
         assert "**test-skill**:" in formatted
         assert "A test skill for validation" in formatted
@@ -122,71 +118,45 @@ class TestFormatSkillsMetadata:
 class TestGetCoordinatorPrompt:
     """Test the get_coordinator_prompt function."""
 
-    def test_injects_project_directory(self, temp_skills_dir):
-        """Should inject project directory path into prompt."""
-        project_dir = "/test/project"
-        prompt = get_coordinator_prompt(project_dir, temp_skills_dir)
-
-        assert "/test/project" in prompt
-
-    def test_injects_features_directory(self, temp_skills_dir):
-        """Should inject features directory path."""
-        project_dir = "/test/project"
-        prompt = get_coordinator_prompt(project_dir, temp_skills_dir)
-
-        assert "/test/project/features" in prompt
-
-    def test_injects_future_features_directory(self, temp_skills_dir):
-        """Should inject future-features directory path."""
-        project_dir = "/test/project"
-        prompt = get_coordinator_prompt(project_dir, temp_skills_dir)
-
-        assert "/test/project/future-features" in prompt
-
-    def test_injects_prompts_directory(self, temp_skills_dir):
-        """Should inject prompts directory path."""
-        project_dir = "/test/project"
-        prompt = get_coordinator_prompt(project_dir, temp_skills_dir)
-
-        assert "/test/project/prompts" in prompt
-
-    def test_injects_skills_directory(self, temp_skills_dir):
+    @pytest.mark.parametrize("expected", [
+        # Injected directory paths
+        "/test/project",
+        "/test/project/features",
+        "/test/project/future-features",
+        "/test/project/prompts",
+        # Injected skill names
+        "test-skill",
+        "another-skill",
+        # Key prompt sections
+        "You are Polly",
+        "Core Purpose",
+        "Available Skills",
+        "Project Structure",
+        "Conversational Interaction Style",
+    ])
+    def test_prompt_contains(self, coordinator_prompt, expected):
+        """Prompt should contain injected values and expected sections."""
+        assert expected in coordinator_prompt
+
+    def test_injects_skills_directory(self, coordinator_prompt, temp_skills_dir):
         """Should inject skills directory path."""
-        project_dir = "/test/project"
-        prompt = get_coordinator_prompt(project_dir, temp_skills_dir)
-
-        assert str(temp_skills_dir) in prompt
+        assert str(temp_skills_dir) in coordinator_prompt
 
-    def test_injects_skills_metadata(self, temp_skills_dir):
-        """Should inject formatted skills metadata."""
-        project_dir = "/test/project"
-        prompt = get_coordinator_prompt(project_dir, temp_skills_dir)
-
-        # Should contain skill names and descriptions
-        assert "test-skill" in prompt
-        assert "another-skill" in prompt
-
-    def test_prompt_structure(self, temp_skills_dir):
-        """Prompt should maintain expected structure."""
-        project_dir = "/test/project"
-        prompt = get_coordinator_prompt(project_dir, temp_skills_dir)
+    def test_no_placeholder_strings(self, coordinator_prompt):
+        """Should not contain unreplaced placeholder strings."""
+        assert PLACEHOLDER_PATTERN.search(coordinator_prompt) is None
+
+    def test_injected_values_are_not_reformatted(self, tmp_path):
+        """Braces inside injected values should be kept verbatim."""
+        skill_dir = tmp_path / "skills" / "brace-skill"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "SKILL.md").write_text("""---
+name: brace-skill
+description: Writes files to {project_directory}/docs
+---
+# Brace Skill""")
 
-        # Should contain key sections
-        assert "You are Polly" in prompt
-        assert "Core Purpose" in prompt
-        assert "Available Skills" in prompt
-        assert "Project Structure" in prompt
-        assert "Conversational Interaction Style" in prompt
+        prompt = get_coordinator_prompt("/test/{prompts_directory}", tmp_path / "skills")
 
-    def test_no_placeholder_strings(self, temp_skills_dir):
-        """Should not contain unreplaced placeholder strings."""
-        project_dir = "/test/project"
-        prompt = get_coordinator_prompt(project_dir, temp_skills_dir)
-
-        # Check for unreplaced placeholders
-        assert "{project_directory}" not in prompt
-        assert "{features_directory}" not in prompt
-        assert "{future_features_directory}" not in prompt
-        assert "{prompts_directory}" not in prompt
-        assert "{skills_directory}" not in prompt
-        assert "{skills_metadata}" not in prompt
+        assert "Writes files to {project_directory}/docs" in prompt
+        assert "/test/{prompts_directory}/features" in prompt
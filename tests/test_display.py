@@ -3,14 +3,46 @@
 import pytest
 from io import StringIO
 from rich.console import Console
+from rich.markdown import Markdown
 
 from feature_breakdown_agent.display import (
+    LeftAlignedHeading,
     LeftAlignedMarkdown,
+    UserInput,
     create_markdown,
+    custom_theme,
+    print_agent_message,
+    print_captured_features,
+    print_error,
+    print_goodbye,
+    print_info,
+    print_success,
+    print_warning,
+    print_welcome,
     console as default_console,
 )
 
 
+@pytest.fixture(scope="module")
+def capture_console():
+    """Create one plain, uncolored in-memory console for the module."""
+    return Console(
+        file=StringIO(),
+        theme=custom_theme,
+        color_system=None,
+        force_terminal=False,
+        width=80,
+    )
+
+
+@pytest.fixture(autouse=True)
+def quiet_console(monkeypatch, capture_console):
+    """Send display output to the shared console, starting from an empty buffer."""
+    capture_console.file.seek(0)
+    capture_console.file.truncate()
+    monkeypatch.setattr("feature_breakdown_agent.display.console", capture_console)
+
+
 class TestLeftAlignedMarkdown:
     """Test the LeftAlignedMarkdown class."""
 
@@ -20,23 +52,25 @@ class TestLeftAlignedMarkdown:
 
         assert isinstance(md, LeftAlignedMarkdown)
 
-    def test_renders_without_error(self):
+    def test_renders_without_error(self, capture_console):
         """Should render markdown text without errors."""
         md = LeftAlignedMarkdown("# Test Heading\n\nSome content")
-        test_console = Console(file=StringIO())
 
         # Should not raise any exceptions
-        test_console.print(md)
+        capture_console.print(md)
+
+        assert "Test Heading" in capture_console.file.getvalue()
 
     def test_uses_custom_heading_class(self):
         """Should use LeftAlignedHeading for headings."""
-        md = LeftAlignedMarkdown("# Test")
+        # The elements dictionary should have our custom class
+        assert LeftAlignedMarkdown.elements["heading_open"] is LeftAlignedHeading
 
-        # Import to check the class
-        from feature_breakdown_agent.display import LeftAlignedHeading
+    def test_base_markdown_headings_unchanged(self):
+        """Should not replace the heading class used by plain Markdown."""
+        LeftAlignedMarkdown("# Test")
 
-        # The elements dictionary should have our custom class
-        assert md.elements["heading_open"] == LeftAlignedHeading
+        assert Markdown.elements["heading_open"] is not LeftAlignedHeading
 
     def test_inline_code_lexer_disabled(self):
         """Should have inline code lexer disabled."""
@@ -77,38 +111,17 @@ class TestCreateMarkdown:
 class TestPrintFunctions:
     """Test print functions with console capture."""
 
-    def test_print_agent_message_plain(self):
-        """Test print_agent_message with plain text."""
-        from feature_breakdown_agent.display import print_agent_message
-
-        test_console = Console(file=StringIO())
-        # We can't easily test this without modifying the module,
-        # so we'll just verify the function exists and is callable
-        assert callable(print_agent_message)
-
-    def test_print_error_function_exists(self):
-        """Test print_error function exists."""
-        from feature_breakdown_agent.display import print_error
-
-        assert callable(print_error)
-
-    def test_print_info_function_exists(self):
-        """Test print_info function exists."""
-        from feature_breakdown_agent.display import print_info
-
-        assert callable(print_info)
-
-    def test_print_success_function_exists(self):
-        """Test print_success function exists."""
-        from feature_breakdown_agent.display import print_success
-
-        assert callable(print_success)
-
-    def test_print_warning_function_exists(self):
-        """Test print_warning function exists."""
-        from feature_breakdown_agent.display import print_warning
-
-        assert callable(print_warning)
+    @pytest.mark.parametrize("print_function", [
+        print_agent_message,
+        print_error,
+        print_info,
+        print_success,
+        print_warning,
+        print_goodbye,
+    ])
+    def test_print_function_exists(self, print_function):
+        """Each print helper should exist and be callable."""
+        assert callable(print_function)
 
 
 class TestConsole:
@@ -120,14 +133,10 @@ class TestConsole:
 
     def test_custom_theme_defined(self):
         """Custom theme should be defined in the module."""
-        from feature_breakdown_agent.display import custom_theme
-
         assert custom_theme is not None
 
     def test_custom_theme_has_required_styles(self):
         """Custom theme should have required style definitions."""
-        from feature_breakdown_agent.display import custom_theme
-
         # Check for expected style names
         assert "agent" in custom_theme.styles
         assert "user" in custom_theme.styles
@@ -138,36 +147,25 @@ class TestConsole:
         assert "info" in custom_theme.styles
 
 
-class TestUserInput:
-    """Test the UserInput class."""
+@pytest.fixture(scope="module")
+def user_input():
+    """Create one UserInput shared by the read-only tests below."""
+    return UserInput()
 
-    def test_user_input_initialization(self):
-        """UserInput should initialize without errors."""
-        from feature_breakdown_agent.display import UserInput
 
-        user_input = UserInput()
+class TestUserInput:
+    """Test the UserInput class."""
 
+    def test_user_input_initialization(self, user_input):
+        """UserInput should initialize with history and a prompt session."""
         assert user_input is not None
         assert hasattr(user_input, 'history')
         assert hasattr(user_input, 'session')
 
-    def test_has_get_input_method(self):
-        """UserInput should have get_input async method."""
-        from feature_breakdown_agent.display import UserInput
-
-        user_input = UserInput()
-
-        assert hasattr(user_input, 'get_input')
-        assert callable(user_input.get_input)
-
-    def test_has_get_input_sync_method(self):
-        """UserInput should have get_input_sync method."""
-        from feature_breakdown_agent.display import UserInput
-
-        user_input = UserInput()
-
-        assert hasattr(user_input, 'get_input_sync')
-        assert callable(user_input.get_input_sync)
+    @pytest.mark.parametrize("method_name", ["get_input", "get_input_sync"])
+    def test_has_input_method(self, user_input, method_name):
+        """UserInput should provide async and sync input methods."""
+        assert callable(getattr(user_input, method_name, None))
 
 
 class TestPrintCapturedFeatures:
@@ -175,21 +173,15 @@ class TestPrintCapturedFeatures:
 
     def test_function_exists(self):
         """print_captured_features should exist."""
-        from feature_breakdown_agent.display import print_captured_features
-
         assert callable(print_captured_features)
 
     def test_handles_empty_list(self):
         """Should handle empty feature paths list."""
-        from feature_breakdown_agent.display import print_captured_features
-
         # Should not raise an error
         print_captured_features([])
 
     def test_handles_feature_list(self):
         """Should handle list of feature paths."""
-        from feature_breakdown_agent.display import print_captured_features
-
         paths = [
             "future-features/feature1.md",
             "future-features/feature2.md"
@@ -204,13 +196,9 @@ class TestPrintWelcome:
 
     def test_function_exists(self):
         """print_welcome should exist."""
-        from feature_breakdown_agent.display import print_welcome
-
         assert callable(print_welcome)
 
     def test_prints_without_error(self):
         """Should print welcome banner without errors."""
-        from feature_breakdown_agent.display import print_welcome
-
         # Should not raise any errors
         print_welcome()
@@ -0,0 +1,105 @@
+"""Tests for feature_breakdown_agent.py module."""
+
+import pytest
+from io import StringIO
+from rich.console import Console
+from claude_agent_sdk import (
+    AssistantMessage,
+    ResultMessage,
+    TextBlock,
+    ToolUseBlock,
+)
+
+from feature_breakdown_agent import display
+from feature_breakdown_agent import feature_breakdown_agent as agent
+
+
+class FakeClient:
+    """Minimal stand-in for ClaudeSDKClient that replays canned messages."""
+
+    def __init__(self, messages):
+        self.messages = messages
+        self.queries = []
+        self.received = 0
+
+    async def query(self, prompt):
+        self.queries.append(prompt)
+
+    async def receive_response(self):
+        for message in self.messages:
+            self.received += 1
+            yield message
+
+
+def assistant(*blocks):
+    """Build an AssistantMessage containing the given blocks."""
+    return AssistantMessage(content=list(blocks), model="test-model")
+
+
+def result():
+    """Build a ResultMessage that ends a turn."""
+    return ResultMessage(
+        subtype="success",
+        duration_ms=1,
+        duration_api_ms=1,
+        is_error=False,
+        num_turns=1,
+        session_id="test-session",
+    )
+
+
+@pytest.fixture
+def output(monkeypatch):
+    """Route all console output to a buffer and return it."""
+    buffer = StringIO()
+    test_console = Console(
+        file=buffer, color_system=None, width=80, theme=display.custom_theme
+    )
+    monkeypatch.setattr(display, "console", test_console)
+    monkeypatch.setattr(agent, "console", test_console)
+    return buffer
+
+
+class TestDriveAgentTurn:
+    """Test the _drive_agent_turn helper."""
+
+    @pytest.mark.asyncio
+    async def test_sends_prompt(self, output):
+        """Should send the prompt to the client."""
+        client = FakeClient([result()])
+
+        await agent._drive_agent_turn(client, "Hello")
+
+        assert client.queries == ["Hello"]
+
+    @pytest.mark.asyncio
+    async def test_displays_text_and_tools(self, output):
+        """Should display text blocks and tool usage as they arrive."""
+        client = FakeClient([
+            assistant(TextBlock(text="Let me look around.")),
+            assistant(ToolUseBlock(id="tool-1", name="Glob", input={})),
+            assistant(TextBlock(text="Found nothing.")),
+            result(),
+        ])
+
+        await agent._drive_agent_turn(client, "Explore")
+
+        rendered = output.getvalue()
+        assert rendered.count("Agent:") == 1
+        assert "Let me look around." in rendered
+        assert "[Using Glob...]" in rendered
+        assert "Found nothing." in rendered
+
+    @pytest.mark.asyncio
+    async def test_stops_at_result_message(self, output):
+        """Should stop reading once the ResultMessage arrives."""
+        client = FakeClient([
+            assistant(TextBlock(text="Done.")),
+            result(),
+            assistant(TextBlock(text="Not displayed.")),
+        ])
+
+        await agent._drive_agent_turn(client, "Go")
+
+        assert client.received == 2
+        assert "Not displayed." not in output.getvalue()
@@ -5,14 +5,156 @@ all skills are properly configured and ready for use.
 """
 
 import pytest
+import functools
+import os
 import re
 from pathlib import Path
+from typing import Dict, NamedTuple, Optional, Tuple
 
 
-# Get the package skills directory
+# Get the package skills directory.
+# Intentionally do NOT import feature_breakdown_agent - we only validate on-disk layout
 PACKAGE_DIR = Path(__file__).parent.parent / "feature_breakdown_agent"
 SKILLS_DIR = PACKAGE_DIR / "skills"
 
+# SKILL.md frontmatter delimiters, matched against the raw file bytes
+FRONTMATTER_START = b"---\n"
+FRONTMATTER_END = b"\n---\n"
+
+# Pattern for validating skill directory names, compiled once for all tests
+KEBAB_CASE_PATTERN = re.compile(r'^[a-z0-9-]+$')
+
+
+@functools.cache
+def _skill_dirs() -> Tuple[Path, ...]:
+    """Return the skill subdirectories, listed once per session.
+
+    os.scandir reports the entry type from the directory listing itself,
+    so this avoids a stat() per entry that Path.is_dir() would issue.
+    """
+    if not SKILLS_DIR.is_dir():
+        return ()
+
+    with os.scandir(SKILLS_DIR) as entries:
+        return tuple(Path(entry.path) for entry in entries if entry.is_dir())
+
+
+def pytest_generate_tests(metafunc):
+    """Run each test that takes skill_dir or parsed_skill once per skill.
+
+    Both arguments are parametrized together from the same directory, so
+    a test that takes both sees one skill per run rather than a cross
+    product. parsed_skill is indirect and the parameters are session-scoped,
+    so the session fixture below is set up once per skill and every test
+    of that skill gets the same parsed SKILL.md.
+
+    The skills directory is only listed when such a test is collected,
+    not when this module is imported.
+    """
+    argnames = [
+        name for name in ("skill_dir", "parsed_skill")
+        if name in metafunc.fixturenames
+    ]
+    if argnames:
+        skill_dirs = _skill_dirs()
+        metafunc.parametrize(
+            argnames,
+            [(skill_dir,) * len(argnames) for skill_dir in skill_dirs],
+            indirect=[name for name in argnames if name == "parsed_skill"],
+            ids=[skill_dir.name for skill_dir in skill_dirs],
+            scope="session",
+        )
+
+
+class SkillParsed(NamedTuple):
+    """A SKILL.md file split into its parts.
+
+    content, frontmatter and body are the undecoded file bytes.
+    frontmatter and body are None when the frontmatter is missing, and
+    fields maps each frontmatter key to its stripped, decoded value.
+    """
+
+    content: bytes
+    frontmatter: Optional[bytes]
+    body: Optional[bytes]
+    fields: Dict[str, str]
+
+
+def _parse_skill_md(content: bytes) -> SkillParsed:
+    """Split SKILL.md content into frontmatter, body and frontmatter fields."""
+    if not content.startswith(FRONTMATTER_START):
+        return SkillParsed(content, None, None, {})
+
+    end = content.find(FRONTMATTER_END, len(FRONTMATTER_START) - 1)
+    if end == -1:
+        return SkillParsed(content, None, None, {})
+
+    frontmatter = content[len(FRONTMATTER_START):end]
+    body = content[end + len(FRONTMATTER_END):]
+    fields = {}
+    for line in frontmatter.splitlines():
+        key, separator, value = line.partition(b":")
+        # Like load_skill_metadata's ^name: pattern, a key must start the
+        # line and sit directly against its colon
+        if separator and key == key.strip():
+            fields[key.decode("utf-8")] = value.strip().decode("utf-8")
+
+    return SkillParsed(content, frontmatter, body, fields)
+
+
+@functools.cache
+def _load_skill(skill_dir: Path) -> SkillParsed:
+    """Read and parse a skill's SKILL.md, at most once per test run.
+
+    Only the frontmatter fields are decoded; the body stays as bytes.
+    CRLF line endings are normalized first, since load_skill_metadata
+    accepts them and a checkout may use them.
+    """
+    content = (skill_dir / "SKILL.md").read_bytes()
+    return _parse_skill_md(content.replace(b"\r\n", b"\n"))
+
+
+@pytest.fixture(scope="session")
+def parsed_skill(request):
+    """Return the parsed SKILL.md of the skill directory in request.param."""
+    return _load_skill(request.param)
+
+
+class TestParseSkillMd:
+    """Validate that the test parser reads fields like the runtime loader."""
+
+    def test_reads_frontmatter_fields(self):
+        """Keys at the start of a line should be read as fields."""
+        parsed = _parse_skill_md(
+            b"---\nname: demo-skill\ndescription: A demo\n---\nBody"
+        )
+
+        assert parsed.fields == {"name": "demo-skill", "description": "A demo"}
+
+    @pytest.mark.parametrize("name_line", [
+        b"name : demo-skill",
+        b"  name: demo-skill",
+        b"\tname: demo-skill",
+    ], ids=["space_before_colon", "indented", "tab_indented"])
+    def test_rejects_fields_the_runtime_rejects(self, name_line):
+        """Lines load_skill_metadata would not match should not count as fields."""
+        parsed = _parse_skill_md(
+            b"---\n" + name_line + b"\ndescription: A demo\n---\nBody"
+        )
+
+        assert "name" not in parsed.fields
+
+    def test_loads_crlf_line_endings(self, tmp_path):
+        """SKILL.md files checked out with CRLF endings should still parse."""
+        (tmp_path / "SKILL.md").write_bytes(
+            b"---\r\nname: demo-skill\r\ndescription: A demo\r\n---\r\nBody\r\n"
+        )
+
+        parsed = _load_skill(tmp_path)
+
+        assert parsed.fields == {"name": "demo-skill", "description": "A demo"}
+        assert parsed.body == b"Body\n"
+
 
 class TestSkillsDirectoryStructure:
     """Validate the skills directory structure."""
@@ -24,105 +166,62 @@ class TestSkillsDirectoryStructure:
 
     def test_has_skill_subdirectories(self):
         """Skills directory should contain skill subdirectories."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
-
-        assert len(skill_dirs) > 0, "No skill subdirectories found"
+        assert len(_skill_dirs()) > 0, "No skill subdirectories found"
 
-    def test_all_expected_skills_exist(self):
-        """All four expected skills should exist."""
-        expected_skills = [
-            "feature-identification",
-            "feature-discovery",
-            "iteration-breakdown",
-            "prompt-generation"
-        ]
-
-        for skill_name in expected_skills:
-            skill_path = SKILLS_DIR / skill_name
-            assert skill_path.exists(), f"Skill directory '{skill_name}' not found"
-            assert skill_path.is_dir(), f"'{skill_name}' is not a directory"
+    @pytest.mark.parametrize("skill_name", [
+        "feature-identification",
+        "feature-discovery",
+        "iteration-breakdown",
+        "prompt-generation",
+    ])
+    def test_expected_skill_exists(self, skill_name):
+        """Each of the four expected skills should exist."""
+        skill_path = SKILLS_DIR / skill_name
+        assert skill_path.exists(), f"Skill directory '{skill_name}' not found"
+        assert skill_path.is_dir(), f"'{skill_name}' is not a directory"
 
 
 class TestSkillMdFiles:
     """Validate SKILL.md files in each skill directory."""
 
-    def test_all_skills_have_skill_md(self):
+    def test_skill_has_skill_md(self, skill_dir):
         """Each skill directory should have a SKILL.md file."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
-
-        for skill_dir in skill_dirs:
-            skill_md = skill_dir / "SKILL.md"
-            assert skill_md.exists(), f"SKILL.md missing in {skill_dir.name}"
-            assert skill_md.is_file(), f"SKILL.md in {skill_dir.name} is not a file"
+        skill_md = skill_dir / "SKILL.md"
+        assert skill_md.exists(), f"SKILL.md missing in {skill_dir.name}"
+        assert skill_md.is_file(), f"SKILL.md in {skill_dir.name} is not a file"
 
-    def test_skill_md_has_yaml_frontmatter(self):
+    def test_skill_md_has_yaml_frontmatter(self, skill_dir, parsed_skill):
         """Each SKILL.md should have YAML frontmatter."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
+        # Check for YAML frontmatter pattern (---\n...\n---)
+        assert parsed_skill.content.startswith(b"---"), \
+            f"SKILL.md in {skill_dir.name} missing YAML frontmatter start"
 
-        for skill_dir in skill_dirs:
-            skill_md = skill_dir / "SKILL.md"
-            content = skill_md.read_text()
+        assert parsed_skill.frontmatter is not None, \
+            f"SKILL.md in {skill_dir.name} has malformed YAML frontmatter"
 
-            # Check for YAML frontmatter pattern (---\n...\n---)
-            assert content.startswith("---"), \
-                f"SKILL.md in {skill_dir.name} missing YAML frontmatter start"
-
-            frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            assert frontmatter_match, \
-                f"SKILL.md in {skill_dir.name} has malformed YAML frontmatter"
-
-    def test_skill_md_has_name_field(self):
+    def test_skill_md_has_name_field(self, skill_dir, parsed_skill):
         """Each SKILL.md should have a 'name' field in frontmatter."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
-
-        for skill_dir in skill_dirs:
-            skill_md = skill_dir / "SKILL.md"
-            content = skill_md.read_text()
+        assert parsed_skill.frontmatter is not None
 
-            frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            assert frontmatter_match
+        assert "name" in parsed_skill.fields, f"SKILL.md in {skill_dir.name} missing 'name' field"
+        assert parsed_skill.fields["name"], f"SKILL.md in {skill_dir.name} has empty 'name' field"
 
-            frontmatter = frontmatter_match.group(1)
-            name_match = re.search(r'^name:\s*(.+)$', frontmatter, re.MULTILINE)
-
-            assert name_match, f"SKILL.md in {skill_dir.name} missing 'name' field"
-            assert name_match.group(1).strip(), \
-                f"SKILL.md in {skill_dir.name} has empty 'name' field"
-
-    def test_skill_md_has_description_field(self):
+    def test_skill_md_has_description_field(self, skill_dir, parsed_skill):
         """Each SKILL.md should have a 'description' field in frontmatter."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
-
-        for skill_dir in skill_dirs:
-            skill_md = skill_dir / "SKILL.md"
-            content = skill_md.read_text()
+        assert parsed_skill.frontmatter is not None
 
-            frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            assert frontmatter_match
+        assert "description" in parsed_skill.fields, \
+            f"SKILL.md in {skill_dir.name} missing 'description' field"
+        assert parsed_skill.fields["description"], \
+            f"SKILL.md in {skill_dir.name} has empty 'description' field"
 
-            frontmatter = frontmatter_match.group(1)
-            desc_match = re.search(r'^description:\s*(.+)$', frontmatter, re.MULTILINE)
-
-            assert desc_match, \
-                f"SKILL.md in {skill_dir.name} missing 'description' field"
-            assert desc_match.group(1).strip(), \
-                f"SKILL.md in {skill_dir.name} has empty 'description' field"
-
-    def test_skill_md_has_content_after_frontmatter(self):
+    def test_skill_md_has_content_after_frontmatter(self, skill_dir, parsed_skill):
         """Each SKILL.md should have instructions after frontmatter."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
-
-        for skill_dir in skill_dirs:
-            skill_md = skill_dir / "SKILL.md"
-            content = skill_md.read_text()
+        assert parsed_skill.body is not None, \
+            f"SKILL.md in {skill_dir.name} has no content after frontmatter"
 
-            frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n(.+)', content, re.DOTALL)
-            assert frontmatter_match, \
-                f"SKILL.md in {skill_dir.name} has no content after frontmatter"
-
-            instructions = frontmatter_match.group(2).strip()
-            assert len(instructions) > 0, \
-                f"SKILL.md in {skill_dir.name} has empty instructions section"
+        assert len(parsed_skill.body.strip()) > 0, \
+            f"SKILL.md in {skill_dir.name} has empty instructions section"
 
 
 class TestSkillTemplateFiles:
@@ -136,88 +235,50 @@ class TestSkillTemplateFiles:
     ])
     def test_skill_has_expected_templates(self, skill_name, expected_templates):
         """Each skill should have its expected template files."""
-        skill_dir = SKILLS_DIR / skill_name
+        # One directory listing per skill gives both names and file types
+        with os.scandir(SKILLS_DIR / skill_name) as entries:
+            file_names = {entry.name for entry in entries if entry.is_file()}
 
-        for template_name in expected_templates:
-            template_path = skill_dir / template_name
-            assert template_path.exists(), \
-                f"Template '{template_name}' missing in {skill_name}"
-            assert template_path.is_file(), \
-                f"'{template_name}' in {skill_name} is not a file"
+        missing = [name for name in expected_templates if name not in file_names]
+        assert not missing, \
+            f"Template file(s) {missing} missing in {skill_name}"
 
 
 class TestSkillNaming:
     """Validate skill naming conventions."""
 
-    def test_skill_name_matches_directory(self):
+    def test_skill_name_matches_directory(self, skill_dir, parsed_skill):
         """Skill 'name' field should match directory name."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
-
-        for skill_dir in skill_dirs:
-            skill_md = skill_dir / "SKILL.md"
-            content = skill_md.read_text()
-
-            frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            frontmatter = frontmatter_match.group(1)
-            name_match = re.search(r'^name:\s*(.+)$', frontmatter, re.MULTILINE)
+        skill_name = parsed_skill.fields.get("name")
+        directory_name = skill_dir.name
 
-            skill_name = name_match.group(1).strip()
-            directory_name = skill_dir.name
+        assert skill_name == directory_name, \
+            f"Skill name '{skill_name}' doesn't match directory '{directory_name}'"
 
-            assert skill_name == directory_name, \
-                f"Skill name '{skill_name}' doesn't match directory '{directory_name}'"
-
-    def test_skill_names_use_kebab_case(self):
+    def test_skill_names_use_kebab_case(self, skill_dir):
         """Skill names should use kebab-case (lowercase with hyphens)."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
-
-        for skill_dir in skill_dirs:
-            directory_name = skill_dir.name
-
-            # Should be lowercase
-            assert directory_name == directory_name.lower(), \
-                f"Skill directory '{directory_name}' should be lowercase"
+        directory_name = skill_dir.name
 
-            # Should only contain letters, numbers, and hyphens
-            assert re.match(r'^[a-z0-9-]+$', directory_name), \
-                f"Skill directory '{directory_name}' should use kebab-case"
+        # Should only contain lowercase letters, numbers, and hyphens
+        assert KEBAB_CASE_PATTERN.match(directory_name), \
+            f"Skill directory '{directory_name}' should use kebab-case"
 
 
 class TestSkillDescriptions:
     """Validate skill descriptions are meaningful."""
 
-    def test_descriptions_are_not_empty(self):
+    def test_descriptions_are_not_empty(self, skill_dir, parsed_skill):
         """Skill descriptions should not be empty or just whitespace."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
+        description = parsed_skill.fields["description"]
 
-        for skill_dir in skill_dirs:
-            skill_md = skill_dir / "SKILL.md"
-            content = skill_md.read_text()
+        assert len(description) > 10, \
+            f"Description in {skill_dir.name} is too short (should be meaningful)"
 
-            frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            frontmatter = frontmatter_match.group(1)
-            desc_match = re.search(r'^description:\s*(.+)$', frontmatter, re.MULTILINE)
-
-            description = desc_match.group(1).strip()
-
-            assert len(description) > 10, \
-                f"Description in {skill_dir.name} is too short (should be meaningful)"
-
-    def test_descriptions_provide_usage_guidance(self):
+    def test_descriptions_provide_usage_guidance(self, skill_dir, parsed_skill):
         """Descriptions should indicate when to use the skill."""
-        skill_dirs = [d for d in SKILLS_DIR.iterdir() if d.is_dir()]
-
-        for skill_dir in skill_dirs:
-            skill_md = skill_dir / "SKILL.md"
-            content = skill_md.read_text()
-
-            frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
-            frontmatter = frontmatter_match.group(1)
-            desc_match = re.search(r'^description:\s*(.+)$', frontmatter, re.MULTILINE)
-
-            description = desc_match.group(1).strip()
+        description = parsed_skill.fields["description"]
 
-            # Description should give context about purpose
-            # (checking length is a simple heuristic for meaningfulness)
-            assert len(description.split()) >= 3, \
-                f"Description in {skill_dir.name} should have at least 3 words"
+        # Description should give context about purpose
+        # (checking length is a simple heuristic for meaningfulness)
+        assert len(description.split()) >= 3, \
+            f"Description in {skill_dir.name} should have at least 3 words"